@@ -2,6 +2,8 @@
 
 __version__ = "0.1.0"
 
+import logging
+
 from .exceptions import (
     FileProcessingError,
     DobbyError,
@@ -9,8 +11,34 @@ from .exceptions import (
     TransformationError,
     ValidationError,
 )
-from .models import StudentOutputRecord, TransformConfig
-from .transformer import StudentDataTransformer
+
+# Silent unless the application configures handlers (see logger.setup_logger)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Re-exports that pull in pydantic or pandas are imported on first access (PEP 562),
+# so `import dobby` and `dobby --version` stay cheap
+_LAZY_EXPORTS = {
+    "StudentOutputRecord": ".models",
+    "TransformConfig": ".config",
+    "StudentDataTransformer": ".transformer",
+}
+
+
+def __getattr__(name: str):
+    """Import heavy re-exports on first access."""
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List module attributes including lazy re-exports."""
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "__version__",
@@ -22,4 +50,4 @@ __all__ = [
     "StudentOutputRecord",
     "TransformConfig",
     "StudentDataTransformer",
-]
\ No newline at end of file
+]
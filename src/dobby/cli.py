@@ -1,29 +1,41 @@
 "Command-line interface for dobby transformation tool."
 
+from contextlib import nullcontext
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import questionary
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from . import __version__
+from .constants import DEFAULT_CHUNK_SIZE
 from .exceptions import DobbyError
-from .logger import setup_logger
-from .models import TransformConfig
-from .transformer import StudentDataTransformer
+
+# pandas, pyarrow and pydantic are imported inside the commands,
+# so --help, --version and argument errors return without loading them
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from .transformer import ErrorLog, StudentDataTransformer
 
 app = typer.Typer(
     name="dobby",
     help="Transform student enrollment CSV data for SN system upload",
     add_completion=False,
+    # Plain Click help: skips importing typer.rich_utils (rich.markdown, pygments)
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 console = Console()
 
+LOG_FILE = Path("logs") / "dobby.log"
+ERROR_LOG_FILE = LOG_FILE.parent / "dobby-errors.csv"
+
+# Tabs and line breaks inside values would split piped tab-separated lines
+PLAIN_ESCAPES = str.maketrans({"\t": "\\t", "\r": "\\r", "\n": "\\n"})
+
 
 def version_callback(value: bool):
     """Print version and exit."""
@@ -32,6 +44,51 @@ def version_callback(value: bool):
         raise typer.Exit()
 
 
+@lru_cache(maxsize=1)
+def _ensure_log_dir() -> None:
+    """Create the log directory once per process."""
+    LOG_FILE.parent.mkdir(exist_ok=True)
+
+
+def init_logging(verbose: bool):
+    """Configure logging to the console (if verbose) and to the log file."""
+    from .logger import setup_logger
+
+    _ensure_log_dir()
+    setup_logger(verbose=verbose, log_file=LOG_FILE)
+
+
+def default_output_file(start_time: datetime) -> Path:
+    """Build the default output path, stamped with the run's start time."""
+    timestamp = start_time.strftime("%Y-%m-%d-%H%M")
+    return Path("data") / f"{timestamp}-alumnos-upload-sn.csv"
+
+
+def create_progress() -> "Progress":
+    """
+    Create a progress bar tracking bytes read from the input file.
+
+    The bar is disabled when the console is not a terminal, so piped or
+    redirected runs start no refresh thread and print no bar.
+    """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeRemainingColumn(),
+        console=console,
+        disable=not console.is_terminal,
+    )
+
+
 @app.command()
 def transform(
     input_file: Path = typer.Argument(
@@ -73,6 +130,29 @@ def transform(
         "--skip-validation",
         help="Skip RUT and email validation",
     ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        help="Rows processed per chunk (bounds memory use on large files)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Cache the parsed input next to the CSV to speed up repeated runs",
+    ),
+    preview_rows: Optional[int] = typer.Option(
+        None,
+        "--preview-rows",
+        min=1,
+        help="Only transform the first N rows (e.g. with --dry-run for a quick check)",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Processes transforming chunks in parallel",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -92,6 +172,7 @@ def transform(
 
     The transformation performs the following operations:
 
+    \b
     - Cleans and formats addresses
     - Validates and formats RUTs
     - Splits names into first and second names
@@ -107,22 +188,26 @@ def transform(
         dobby transform input.csv --rbd 123 --year 2026 --verbose
 
         dobby transform input.csv --dry-run
+
+        dobby transform input.csv --dry-run --preview-rows 100
     """
+    from .config import TransformConfig
+    from .transformer import StudentDataTransformer, atomic_output
+
     # Setup logger
-    log_file = Path("logs") / "dobby.log"
-    log_file.parent.mkdir(exist_ok=True)
-    setup_logger(verbose=verbose, log_file=log_file)
+    init_logging(verbose)
+
+    # Get start time (also stamps the default output file name)
+    start_time = datetime.now()
 
     # Set default output file if not provided
     if output_file is None:
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M")
-        output_file = Path("data") / f"{timestamp}-alumnos-upload-sn.csv"
-        output_file.parent.mkdir(exist_ok=True)
+        output_file = default_output_file(start_time)
+        # The data/ directory is only needed when the file is actually written
+        if not dry_run:
+            output_file.parent.mkdir(exist_ok=True)
 
     try:
-        # Get start time
-        start_time = datetime.now()
-
         # Create configuration
         config = TransformConfig(
             rbd=rbd,
@@ -130,69 +215,32 @@ def transform(
             local=local,
             validate_rut=not skip_validation,
             validate_email=not skip_validation,
+            cache_parsed_csv=cache,
+            chunk_size=chunk_size,
+            preview_rows=preview_rows,
         )
 
-        # Execute transformation with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Procesando...", total=None)
+        # Execute transformation with progress indicator; chunks go to a
+        # temporary file that only replaces the output once all are written
+        output = nullcontext(None) if dry_run else atomic_output(output_file)
+        with create_progress() as progress, output as partial_file:
+            task = progress.add_task("Procesando...", total=input_file.stat().st_size)
 
             transformer = StudentDataTransformer(config)
-            df = transformer.transform(input_file)
-
-            progress.update(task, completed=True)
-
-        # Calculate statistics
-        total_records = transformer.input_row_count
-        successful_records = total_records - len(transformer.errors)
-        error_records = len(transformer.errors)
-
-        # Display KISS summary
-        console.print("\n" + "=" * 70)
-        console.print(f"[bold cyan]REPORTE DE TRANSFORMACIÓN[/bold cyan]")
-        console.print("=" * 70)
-        console.print(f"Fecha y hora: [cyan]{start_time.strftime('%Y-%m-%d %H:%M:%S')}[/cyan]")
-        console.print(f"Archivo entrada: [cyan]{input_file}[/cyan]")
-        console.print(f"Archivo salida: [cyan]{output_file}[/cyan]")
-        console.print("-" * 70)
-        console.print(f"Registros totales: [bold]{total_records}[/bold]")
-        console.print(f"Procesados correctamente: [green]{successful_records}[/green]")
-        console.print(f"Procesados con errores: [{'yellow' if error_records > 0 else 'green'}]{error_records}[/{'yellow' if error_records > 0 else 'green'}]")
-
-        # Show errors if any
-        if transformer.errors:
-            console.print("\n" + "-" * 70)
-            console.print("[yellow]ERRORES ENCONTRADOS:[/yellow]")
-            console.print("-" * 70)
-
-            error_table = Table(show_header=True, box=None, padding=(0, 2))
-            error_table.add_column("Fila", style="cyan", justify="right")
-            error_table.add_column("Campo", style="yellow")
-            error_table.add_column("Valor", style="white", max_width=30)
-            error_table.add_column("Error", style="red")
-
-            for error in transformer.errors:
-                error_table.add_row(
-                    str(error["row"] + 2),  # +2 para incluir header y convertir a 1-based
-                    error["field"],
-                    str(error.get("value", ""))[:28],
-                    error["error"],
+            for i, _ in enumerate(transformer.transform_stream(input_file, workers=workers)):
+                if partial_file is not None:
+                    transformer.save_csv(partial_file, append=i > 0)
+                progress.update(
+                    task,
+                    completed=transformer.input_bytes_read,
+                    description=f"Procesando... {transformer.input_row_count} filas",
                 )
 
-            console.print(error_table)
-            console.print("\n[dim]Nota: El número de fila corresponde a la línea en el archivo CSV de entrada[/dim]")
+            progress.update(task, completed=input_file.stat().st_size)
 
-        console.print("=" * 70 + "\n")
-
-        # Preview or save
-        if dry_run:
-            console.print("[yellow]Modo prueba - no se escribió ningún archivo[/yellow]\n")
-        else:
-            transformer.save_csv(output_file)
-            console.print(f"[green]✓ Transformación completada exitosamente[/green]\n")
+        print_transform_report(
+            transformer, input_file, output_file, start_time, dry_run=dry_run
+        )
 
     except DobbyError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -214,6 +262,23 @@ def validate(
         dir_okay=False,
         readable=True,
     ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        help="Rows processed per chunk (bounds memory use on large files)",
+    ),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help="Cache the parsed input next to the CSV to speed up repeated runs",
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Processes transforming chunks in parallel",
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose",
@@ -224,6 +289,7 @@ def validate(
     """
     Validate input CSV without performing transformation.
 
+    \b
     This command checks:
     - Required columns are present
     - RUT format and check digits
@@ -234,56 +300,39 @@ def validate(
 
         dobby validate data/alumnos_ser.csv
     """
+    from .config import TransformConfig
+    from .transformer import StudentDataTransformer
+
     # Setup logger
-    log_file = Path("logs") / "dobby.log"
-    log_file.parent.mkdir(exist_ok=True)
-    setup_logger(verbose=verbose, log_file=log_file)
+    init_logging(verbose)
 
     try:
         console.print(f"[cyan]Validando {input_file}...[/cyan]\n")
 
-        config = TransformConfig(validate_rut=True, validate_email=True)
+        config = TransformConfig(
+            validate_rut=True,
+            validate_email=True,
+            cache_parsed_csv=cache,
+            chunk_size=chunk_size,
+        )
         transformer = StudentDataTransformer(config)
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Validando...", total=None)
-            transformer.transform(input_file)
-            progress.update(task, completed=True)
+        with create_progress() as progress:
+            task = progress.add_task("Validando...", total=input_file.stat().st_size)
+            for _ in transformer.transform_stream(input_file, workers=workers):
+                progress.update(
+                    task,
+                    completed=transformer.input_bytes_read,
+                    description=f"Validando... {transformer.input_row_count} filas",
+                )
+            progress.update(task, completed=input_file.stat().st_size)
 
         if not transformer.errors:
             console.print("[green]Validación exitosa - no se encontraron errores[/green]")
         else:
             console.print(f"[yellow]Se encontraron {len(transformer.errors)} problemas de validación:[/yellow]\n")
 
-            error_table = Table(show_header=True)
-            error_table.add_column("Fila", style="cyan")
-            error_table.add_column("Campo", style="yellow")
-            error_table.add_column("Valor", style="white")
-            error_table.add_column("Error", style="red")
-
-            for error in transformer.errors[:20]:  # Show first 20 errors
-                error_table.add_row(
-                    str(error["row"]),
-                    error["field"],
-                    str(error.get("value", ""))[:30],
-                    error["error"],
-                )
-
-            if len(transformer.errors) > 20:
-                error_table.add_row(
-                    "...",
-                    "...",
-                    "...",
-                    f"y {len(transformer.errors) - 20} más",
-                    style="dim",
-                )
-
-            console.print(error_table)
-            console.print()
+            print_validation_errors(transformer.errors)
             raise typer.Exit(code=1)
 
     except typer.Exit:
@@ -323,6 +372,189 @@ def main(
     show_interactive_menu()
 
 
+def print_transform_report(
+    transformer: "StudentDataTransformer",
+    input_file: Path,
+    output_file: Path,
+    start_time: datetime,
+    dry_run: bool = False,
+):
+    """
+    Print the summary shown after a transformation.
+
+    The report is assembled as markup lines and printed in a few calls
+    (summary, error table, footer) rather than one call per line.
+
+    Args:
+        transformer: Transformer that ran the pipeline
+        input_file: Input CSV file path
+        output_file: Output CSV file path
+        start_time: When the transformation started
+        dry_run: Whether the output file was left unwritten
+    """
+    # Calculate statistics
+    total_records = transformer.input_row_count
+    error_records = len(transformer.errors)
+    successful_records = total_records - error_records
+    error_style = "yellow" if error_records > 0 else "green"
+
+    # Display KISS summary
+    lines = [
+        "",
+        "=" * 70,
+        "[bold cyan]REPORTE DE TRANSFORMACIÓN[/bold cyan]",
+        "=" * 70,
+        f"Fecha y hora: [cyan]{start_time.strftime('%Y-%m-%d %H:%M:%S')}[/cyan]",
+        f"Archivo entrada: [cyan]{input_file}[/cyan]",
+        f"Archivo salida: [cyan]{output_file}[/cyan]",
+        "-" * 70,
+        f"Registros totales: [bold]{total_records}[/bold]",
+        f"Procesados correctamente: [green]{successful_records}[/green]",
+        f"Procesados con errores: [{error_style}]{error_records}[/{error_style}]",
+    ]
+
+    # Show errors if any
+    footer = []
+    if transformer.errors:
+        lines += ["", "-" * 70, "[yellow]ERRORES ENCONTRADOS:[/yellow]", "-" * 70]
+        footer += [
+            "",
+            "[dim]Nota: El número de fila corresponde a la línea en el archivo CSV de entrada[/dim]",
+        ]
+
+    footer += ["=" * 70, ""]
+
+    # Output was written chunk by chunk during processing
+    if dry_run:
+        footer += ["[yellow]Modo prueba - no se escribió ningún archivo[/yellow]", ""]
+    else:
+        footer += ["[green]✓ Transformación completada exitosamente[/green]", ""]
+
+    console.print("\n".join(lines))
+    if transformer.errors:
+        print_transform_errors(transformer.errors)
+    console.print("\n".join(footer))
+
+
+def write_plain(lines: list[str]):
+    """
+    Write lines straight to the console's output file.
+
+    Used for piped or redirected output, where Rich would still lay out
+    every line (tab expansion, wrapping) without anything to style.
+
+    Args:
+        lines: Lines to write, without trailing newlines
+    """
+    console.file.write("\n".join(lines) + "\n")
+
+
+def print_transform_errors(errors: "ErrorLog"):
+    """
+    Print the transformation error report.
+
+    Uses a Rich table on a terminal, showing at most two screens of errors;
+    the full list is then written to logs/dobby-errors.csv. When output is
+    piped or redirected, prints every error as plain tab-separated lines in a
+    single block instead, skipping Rich's table layout and per-line rendering.
+    """
+    if not console.is_terminal:
+        # Fila +2 para incluir header y convertir a 1-based
+        row_labels = [str(row + 2) for row in errors.rows]
+        value_labels = [str(value)[:28].translate(PLAIN_ESCAPES) for value in errors.values]
+        lines = ["Fila\tCampo\tValor\tError"]
+        lines.extend(
+            "\t".join(columns)
+            for columns in zip(
+                row_labels, errors.fields, value_labels, errors.messages, strict=True
+            )
+        )
+        write_plain(lines)
+        return
+
+    from rich.table import Table
+
+    n_errors = len(errors)
+    display_limit = min(n_errors, console.size.height * 2)
+    row_labels = [str(row + 2) for row in errors.rows[:display_limit]]
+    value_labels = [str(value)[:28] for value in errors.values[:display_limit]]
+
+    error_table = Table(show_header=True, box=None, padding=(0, 2))
+    error_table.add_column("Fila", style="cyan", justify="right")
+    error_table.add_column("Campo", style="yellow")
+    error_table.add_column("Valor", style="white", max_width=30)
+    error_table.add_column("Error", style="red")
+
+    for columns in zip(
+        row_labels,
+        errors.fields[:display_limit],
+        value_labels,
+        errors.messages[:display_limit],
+        strict=True,
+    ):
+        error_table.add_row(*columns)
+
+    if display_limit < n_errors:
+        _ensure_log_dir()
+        errors.save_csv(ERROR_LOG_FILE, row_offset=2)
+        error_table.add_row(
+            "...", "", "", f"y {n_errors - display_limit} más (ver {ERROR_LOG_FILE})"
+        )
+
+    console.print(error_table)
+
+
+def print_validation_errors(errors: "ErrorLog", limit: int = 20):
+    """
+    Print the first validation errors found by the validate commands.
+
+    Rows are formatted once up front. When output is piped or redirected,
+    they are printed as plain tab-separated lines instead of a Rich table.
+
+    Args:
+        errors: Validation errors to show
+        limit: Maximum number of errors listed
+    """
+    rows = [
+        (str(row), field, str(value)[:30], message)
+        for row, field, value, message in zip(
+            errors.rows[:limit],
+            errors.fields[:limit],
+            errors.values[:limit],
+            errors.messages[:limit],
+            strict=True,
+        )
+    ]
+    hidden = len(errors) - len(rows)
+
+    if not console.is_terminal:
+        lines = [
+            "\t".join((row, field, value.translate(PLAIN_ESCAPES), message))
+            for row, field, value, message in rows
+        ]
+        if hidden > 0:
+            lines.append(f"... y {hidden} más")
+        write_plain(lines + [""])
+        return
+
+    from rich.table import Table
+
+    error_table = Table(show_header=True)
+    error_table.add_column("Fila", style="cyan")
+    error_table.add_column("Campo", style="yellow")
+    error_table.add_column("Valor", style="white")
+    error_table.add_column("Error", style="red")
+
+    for columns in rows:
+        error_table.add_row(*columns)
+
+    if hidden > 0:
+        error_table.add_row("...", "...", "...", f"y {hidden} más", style="dim")
+
+    console.print(error_table)
+    console.print()
+
+
 def show_dobby_header():
     """Display Dobby ASCII art header."""
     dobby_art = """[bold cyan]
@@ -343,9 +575,16 @@ def show_dobby_header():
 
 def show_interactive_menu():
     """Show interactive menu for user to select action."""
+    import questionary
+
+    from .transformer import StudentDataTransformer
+
     show_dobby_header()
     console.print("[bold cyan]Estoy aquí para ayudar con los datos, señor[/bold cyan]\n")
 
+    # Reused across menu actions; each run resets it with its own configuration
+    transformer = StudentDataTransformer()
+
     while True:
         action = questionary.select(
             "¿Qué deseas hacer?",
@@ -369,15 +608,25 @@ def show_interactive_menu():
             break
 
         if action == "Transformar archivo CSV":
-            interactive_transform()
+            interactive_transform(transformer)
         elif action == "Validar archivo CSV":
-            interactive_validate()
+            interactive_validate(transformer)
         elif action == "Ver información y ayuda":
             show_help()
 
 
-def interactive_transform():
-    """Interactive transformation workflow."""
+def interactive_transform(transformer: Optional["StudentDataTransformer"] = None):
+    """
+    Interactive transformation workflow.
+
+    Args:
+        transformer: Transformer to reuse. A new one is created if not provided.
+    """
+    import questionary
+
+    from .config import TransformConfig
+    from .transformer import StudentDataTransformer, atomic_output
+
     console.print("\n[bold]Transformación de archivo CSV[/bold]\n")
 
     # Get input file
@@ -397,8 +646,7 @@ def interactive_transform():
         return
 
     # Get output file
-    timestamp = datetime.now().strftime("%Y-%m-%d-%H%M")
-    default_output = f"data/{timestamp}-alumnos-upload-sn.csv"
+    default_output = str(default_output_file(datetime.now()))
 
     use_default_output = questionary.confirm(
         f"¿Usar nombre de salida por defecto? ({default_output})", default=True
@@ -433,12 +681,11 @@ def interactive_transform():
     verbose = questionary.confirm("¿Habilitar modo verboso?", default=False).ask()
 
     # Setup logger
-    log_file = Path("logs") / "dobby.log"
-    log_file.parent.mkdir(exist_ok=True)
-    setup_logger(verbose=verbose, log_file=log_file)
+    init_logging(verbose)
 
     # Create output directory
-    output_file.parent.mkdir(exist_ok=True)
+    if not dry_run:
+        output_file.parent.mkdir(exist_ok=True)
 
     try:
         start_time = datetime.now()
@@ -452,71 +699,30 @@ def interactive_transform():
             validate_email=not skip_validation,
         )
 
-        # Execute transformation with progress indicator
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Procesando...", total=None)
-
-            transformer = StudentDataTransformer(config)
-            df = transformer.transform(input_file)
-
-            progress.update(task, completed=True)
-
-        # Calculate statistics
-        total_records = transformer.input_row_count
-        successful_records = total_records - len(transformer.errors)
-        error_records = len(transformer.errors)
-
-        # Display KISS summary
-        console.print("\n" + "=" * 70)
-        console.print(f"[bold cyan]REPORTE DE TRANSFORMACIÓN[/bold cyan]")
-        console.print("=" * 70)
-        console.print(f"Fecha y hora: [cyan]{start_time.strftime('%Y-%m-%d %H:%M:%S')}[/cyan]")
-        console.print(f"Archivo entrada: [cyan]{input_file}[/cyan]")
-        console.print(f"Archivo salida: [cyan]{output_file}[/cyan]")
-        console.print("-" * 70)
-        console.print(f"Registros totales: [bold]{total_records}[/bold]")
-        console.print(f"Procesados correctamente: [green]{successful_records}[/green]")
-        console.print(
-            f"Procesados con errores: [{'yellow' if error_records > 0 else 'green'}]{error_records}[/{'yellow' if error_records > 0 else 'green'}]"
-        )
-
-        # Show errors if any
-        if transformer.errors:
-            console.print("\n" + "-" * 70)
-            console.print("[yellow]ERRORES ENCONTRADOS:[/yellow]")
-            console.print("-" * 70)
-
-            error_table = Table(show_header=True, box=None, padding=(0, 2))
-            error_table.add_column("Fila", style="cyan", justify="right")
-            error_table.add_column("Campo", style="yellow")
-            error_table.add_column("Valor", style="white", max_width=30)
-            error_table.add_column("Error", style="red")
-
-            for error in transformer.errors:
-                error_table.add_row(
-                    str(error["row"] + 2),  # +2 para incluir header y convertir a 1-based
-                    error["field"],
-                    str(error.get("value", ""))[:28],
-                    error["error"],
+        # Execute transformation with progress indicator; chunks go to a
+        # temporary file that only replaces the output once all are written
+        output = nullcontext(None) if dry_run else atomic_output(output_file)
+        with create_progress() as progress, output as partial_file:
+            task = progress.add_task("Procesando...", total=input_file.stat().st_size)
+
+            if transformer is None:
+                transformer = StudentDataTransformer(config)
+            else:
+                transformer.reset(config)
+            for i, _ in enumerate(transformer.transform_stream(input_file)):
+                if partial_file is not None:
+                    transformer.save_csv(partial_file, append=i > 0)
+                progress.update(
+                    task,
+                    completed=transformer.input_bytes_read,
+                    description=f"Procesando... {transformer.input_row_count} filas",
                 )
 
-            console.print(error_table)
-            console.print(
-                "\n[dim]Nota: El número de fila corresponde a la línea en el archivo CSV de entrada[/dim]"
-            )
-
-        console.print("=" * 70 + "\n")
+            progress.update(task, completed=input_file.stat().st_size)
 
-        # Preview or save
-        if dry_run:
-            console.print("[yellow]Modo prueba - no se escribió ningún archivo[/yellow]\n")
-        else:
-            transformer.save_csv(output_file)
-            console.print(f"[green]✓ Transformación completada exitosamente[/green]\n")
+        print_transform_report(
+            transformer, input_file, output_file, start_time, dry_run=dry_run
+        )
 
     except DobbyError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -526,8 +732,18 @@ def interactive_transform():
             console.print_exception()
 
 
-def interactive_validate():
-    """Interactive validation workflow."""
+def interactive_validate(transformer: Optional["StudentDataTransformer"] = None):
+    """
+    Interactive validation workflow.
+
+    Args:
+        transformer: Transformer to reuse. A new one is created if not provided.
+    """
+    import questionary
+
+    from .config import TransformConfig
+    from .transformer import StudentDataTransformer
+
     console.print("\n[bold]Validación de archivo CSV[/bold]\n")
 
     # Get input file
@@ -549,24 +765,26 @@ def interactive_validate():
     verbose = questionary.confirm("¿Habilitar modo verboso?", default=False).ask()
 
     # Setup logger
-    log_file = Path("logs") / "dobby.log"
-    log_file.parent.mkdir(exist_ok=True)
-    setup_logger(verbose=verbose, log_file=log_file)
+    init_logging(verbose)
 
     try:
         console.print(f"\n[cyan]Validando {input_file}...[/cyan]\n")
 
         config = TransformConfig(validate_rut=True, validate_email=True)
-        transformer = StudentDataTransformer(config)
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Validando...", total=None)
-            transformer.transform(input_file)
-            progress.update(task, completed=True)
+        if transformer is None:
+            transformer = StudentDataTransformer(config)
+        else:
+            transformer.reset(config)
+
+        with create_progress() as progress:
+            task = progress.add_task("Validando...", total=input_file.stat().st_size)
+            for _ in transformer.transform_stream(input_file):
+                progress.update(
+                    task,
+                    completed=transformer.input_bytes_read,
+                    description=f"Validando... {transformer.input_row_count} filas",
+                )
+            progress.update(task, completed=input_file.stat().st_size)
 
         if not transformer.errors:
             console.print("[green]✓ Validación exitosa - no se encontraron errores[/green]\n")
@@ -575,31 +793,7 @@ def interactive_validate():
                 f"[yellow]Se encontraron {len(transformer.errors)} problemas de validación:[/yellow]\n"
             )
 
-            error_table = Table(show_header=True)
-            error_table.add_column("Fila", style="cyan")
-            error_table.add_column("Campo", style="yellow")
-            error_table.add_column("Valor", style="white")
-            error_table.add_column("Error", style="red")
-
-            for error in transformer.errors[:20]:  # Show first 20 errors
-                error_table.add_row(
-                    str(error["row"]),
-                    error["field"],
-                    str(error.get("value", ""))[:30],
-                    error["error"],
-                )
-
-            if len(transformer.errors) > 20:
-                error_table.add_row(
-                    "...",
-                    "...",
-                    "...",
-                    f"y {len(transformer.errors) - 20} más",
-                    style="dim",
-                )
-
-            console.print(error_table)
-            console.print()
+            print_validation_errors(transformer.errors)
 
     except DobbyError as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -609,11 +803,7 @@ def interactive_validate():
             console.print_exception()
 
 
-def show_help():
-    """Show help information."""
-    console.print("\n[bold cyan]Información y Ayuda[/bold cyan]\n")
-
-    help_text = f"""
+HELP_TEXT = f"""
 [bold]Dobby v{__version__}[/bold] - Transformador de Datos de Matrícula Estudiantil
 
 [bold yellow]Descripción:[/bold yellow]
@@ -656,7 +846,20 @@ Los logs se guardan en: logs/dobby.log
 Consulta el archivo README.md para documentación completa.
 """
 
-    console.print(Panel(help_text, border_style="cyan"))
+
+@lru_cache(maxsize=1)
+def _help_panel():
+    """Build the help panel once, parsing its markup a single time."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(Text.from_markup(HELP_TEXT), border_style="cyan")
+
+
+def show_help():
+    """Show help information."""
+    console.print("\n[bold cyan]Información y Ayuda[/bold cyan]\n")
+    console.print(_help_panel())
     console.print()
 
 
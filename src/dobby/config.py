@@ -0,0 +1,56 @@
+"""Transformation configuration."""
+
+from dataclasses import dataclass
+from typing import Literal, Optional
+
+from .constants import DEFAULT_CHUNK_SIZE
+
+
+@dataclass(slots=True, frozen=True)
+class TransformConfig:
+    """
+    Configuration for transformation process.
+
+    Values come from the CLI, which already type-checks them, so this is a
+    plain frozen dataclass rather than a validated Pydantic model. Only the
+    constraints typer cannot express for library callers are checked.
+
+    Attributes:
+        rbd: School RBD identifier
+        year: Academic year
+        local: School location
+        input_encoding: Input CSV encoding
+        output_encoding: Output CSV encoding
+        csv_separator: CSV field separator
+        csv_engine: Parser used to read the input, whole or in chunks (the
+            Feather cache is only used with "pyarrow")
+        validate_rut: Validate RUT check digits
+        validate_email: Validate email formats
+        skip_invalid_rows: Skip rows with validation errors
+        cache_parsed_csv: Cache the parsed input as Feather next to the CSV
+        chunk_size: Rows transformed per chunk when streaming
+        preview_rows: Only read the first N input rows
+    """
+
+    rbd: int = 574
+    year: int = 2025
+    local: str = "Principal"
+    input_encoding: str = "utf-8-sig"
+    output_encoding: str = "utf-8-sig"
+    csv_separator: str = ";"
+    csv_engine: Literal["pyarrow", "pandas"] = "pyarrow"
+    validate_rut: bool = True
+    validate_email: bool = True
+    skip_invalid_rows: bool = False
+    cache_parsed_csv: bool = False
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    preview_rows: Optional[int] = None
+
+    def __post_init__(self):
+        """Reject values the transformer cannot work with."""
+        if self.csv_engine not in ("pyarrow", "pandas"):
+            raise ValueError("csv_engine must be 'pyarrow' or 'pandas'")
+        if self.chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if self.preview_rows is not None and self.preview_rows < 1:
+            raise ValueError("preview_rows must be at least 1")
@@ -9,6 +9,12 @@ DEFAULT_YEAR = 2025
 # School location default value
 DEFAULT_LOCAL = "Principal"
 
+# Bytes handed to each PyArrow CSV parser thread when reading input
+CSV_BLOCK_SIZE = 8 << 20
+
+# Rows transformed per chunk when streaming large inputs
+DEFAULT_CHUNK_SIZE = 100_000
+
 # Mapping of commune codes to names
 COMUNA_CODES = {
     0: "SIN COMUNA",
@@ -125,6 +131,37 @@ INPUT_COLUMNS = [
     "Codigo de firma de contrato",
 ]
 
+# Input columns the pipeline reads, always parsed as text whatever their values
+# look like, so every chunk of a file gets the same types (a chunk of blank names
+# is not read as floats, and grade 7 never becomes 7.0 next to a blank grade)
+TEXT_INPUT_COLUMNS = (
+    "Rut",
+    "Digito verificador",
+    "Nombres",
+    "Apellido Paterno",
+    "Apellido Materno",
+    "Sexo",
+    "Fecha de Nacimiento",
+    "Direccion",
+    "Comuna",
+    "Email Estudiante",
+    "Grado",
+    "Letra",
+    "Rut Apoderado",
+    "Nombre Apoderado",
+    "Apellido Paterno Apo.",
+    "Apellido Materno Apo.",
+    "Celular Apoderado",
+    "Email Apoderado",
+    "Fecha de Matrícula",
+    "Rut Apoderado SPL",
+    "Nombre Apoderado SPL",
+    "Apellido Paterno Apo. SPL",
+    "Apellido Materno Apo. SPL",
+    "Celular SPL",
+    "Email Apoderado SPL",
+)
+
 # Expected output CSV columns (29 columns for SN system)
 OUTPUT_COLUMNS = [
     "rbd",
@@ -1,6 +1,8 @@
-import sys
+import logging
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from loguru import logger
+
+logger = logging.getLogger("dobby")
 
 def setup_logger(verbose: bool = False, log_file: Path | None = None):
     """
@@ -10,27 +12,38 @@ def setup_logger(verbose: bool = False, log_file: Path | None = None):
         verbose: If True, show DEBUG logs to console. If False, only log to file
         log_file: Optional path to save logs to file
     """
-    logger.remove()
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
 
     # Only show console logs in verbose mode
     if verbose:
-        log_level = "DEBUG"
-        logger.add(
-            sys.stderr,
-            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-            level=log_level,
-            colorize=True,
+        from rich.console import Console
+        from rich.logging import RichHandler
+
+        console_handler = RichHandler(
+            console=Console(stderr=True),
+            show_path=False,
+            log_time_format="%H:%M:%S",
         )
+        logger.addHandler(console_handler)
 
     # Always log to file if provided
     if log_file:
-        logger.add(
+        file_handler = RotatingFileHandler(
             log_file,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {message}",
-            level="DEBUG",
-            rotation="10 MB",
-            retention="1 week",
-            compression="zip",
+            maxBytes=10 * 1024 * 1024,
+            backupCount=5,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s | %(levelname)-8s | %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
         )
+        logger.addHandler(file_handler)
 
     return logger
@@ -3,12 +3,21 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Re-exported for backwards compatibility; the config lives in .config so the
+# CLI and transformer can use it without importing pydantic
+from .config import TransformConfig
+
+__all__ = ["StudentOutputRecord", "TransformConfig"]
 
 
 class StudentOutputRecord(BaseModel):
     """Model for output CSV record (SN system format)."""
 
+    # Records are built once and never reassigned, so assignment is not re-validated
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     rbd: int = Field(description="School RBD identifier")
     year: int = Field(description="Academic year")
     nivel: str = Field(description="Grade level description")
@@ -62,28 +71,3 @@ class StudentOutputRecord(BaseModel):
         if v != 0 and (v < 900000000 or v > 999999999):
             raise ValueError("Phone must be 9 digits starting with 9, or 0")
         return v
-
-    class Config:
-        """Pydantic model configuration."""
-
-        str_strip_whitespace = True
-        validate_assignment = True
-
-
-class TransformConfig(BaseModel):
-    """Configuration for transformation process."""
-
-    rbd: int = Field(default=574, description="School RBD identifier")
-    year: int = Field(default=2025, description="Academic year")
-    local: str = Field(default="Principal", description="School location")
-    input_encoding: str = Field(default="utf-8-sig", description="Input CSV encoding")
-    output_encoding: str = Field(default="utf-8-sig", description="Output CSV encoding")
-    csv_separator: str = Field(default=";", description="CSV field separator")
-    validate_rut: bool = Field(default=True, description="Validate RUT check digits")
-    validate_email: bool = Field(default=True, description="Validate email formats")
-    skip_invalid_rows: bool = Field(default=False, description="Skip rows with validation errors")
-
-    class Config:
-        """Pydantic model configuration."""
-
-        validate_assignment = True
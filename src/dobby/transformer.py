@@ -1,24 +1,241 @@
 """Student data transformation logic."""
 
+import codecs
+import glob
+import logging
+import multiprocessing
+import os
 import re
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
-from loguru import logger
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
 
+from .config import TransformConfig
 from .constants import (
     COLUMN_RENAME_MAP,
     COMUNA_CODES,
+    CSV_BLOCK_SIZE,
     DEFAULT_LOCAL,
     DEFAULT_RBD,
     DEFAULT_YEAR,
     GRADE_LEVELS,
     OUTPUT_COLUMNS,
+    TEXT_INPUT_COLUMNS,
 )
 from .exceptions import FileProcessingError, MissingColumnError, TransformationError
-from .models import TransformConfig
-from .validators import clean_address, format_rut, validate_email, validate_rut
+from .validators import (
+    clean_addresses,
+    clean_phones,
+    format_rut,
+    validate_emails,
+    validate_ruts,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _arrow_encoding(encoding: str) -> str:
+    """
+    Map a Python codec name to the encoding Arrow should read with.
+
+    Arrow parses UTF-8 natively and skips a leading BOM, so "utf-8-sig"
+    can use the fast path instead of being transcoded through Python.
+
+    Args:
+        encoding: Python codec name from the configuration
+
+    Returns:
+        Encoding name for pyarrow.csv.ReadOptions
+    """
+    if codecs.lookup(encoding).name in ("utf-8", "utf-8-sig"):
+        return "utf8"
+    return encoding
+
+
+@contextmanager
+def atomic_output(output_path: Path) -> Iterator[Path]:
+    """
+    Write an output file through a temporary file next to it.
+
+    The temporary file is moved onto output_path only if the block finishes
+    without raising, so a failed run leaves neither a partial file nor a
+    half-overwritten previous output behind.
+
+    Args:
+        output_path: Final path of the output file
+
+    Yields:
+        Temporary path to write the output to
+    """
+    output_path = Path(output_path)
+    partial_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.partial")
+    try:
+        yield partial_path
+        # The block may have written nothing at all
+        if partial_path.exists():
+            os.replace(partial_path, output_path)
+    finally:
+        partial_path.unlink(missing_ok=True)
+
+
+def _comuna_name(code: Any) -> Any:
+    """
+    Look up the name of a commune code, read either as a number or as text.
+
+    Args:
+        code: Commune code from the input
+
+    Returns:
+        Commune name, or the code itself if it is unknown
+    """
+    key = int(code) if isinstance(code, str) and code.strip().isdigit() else code
+    return COMUNA_CODES.get(key, code)
+
+
+def _table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Convert a parsed table to a dataframe with Arrow-backed text columns.
+
+    Text becomes pandas' pyarrow-backed string dtype with NaN for missing
+    values. That is the default on pandas 3; it is requested explicitly so
+    pandas 2.3, where to_pandas() gives object columns, runs the .str
+    operations on Arrow arrays too.
+
+    Args:
+        table: Parsed input table
+
+    Returns:
+        Dataframe holding the table's rows
+    """
+    text = pd.StringDtype("pyarrow", na_value=np.nan)
+    return table.to_pandas(types_mapper={pa.string(): text, pa.large_string(): text}.get)
+
+
+def _formats_like_pandas(data_type: pa.DataType) -> bool:
+    """
+    Check whether Arrow's CSV writer formats a type the same way as pandas.
+
+    Floats, booleans and timestamps are rendered differently (e.g. "1" vs
+    "1.0", "true" vs "True"), so tables holding them are written by pandas.
+
+    Args:
+        data_type: Arrow type of an output column
+
+    Returns:
+        True if Arrow's text for the type matches DataFrame.to_csv
+    """
+    return (
+        pa.types.is_integer(data_type)
+        or pa.types.is_string(data_type)
+        or pa.types.is_large_string(data_type)
+        or pa.types.is_date32(data_type)
+        or pa.types.is_null(data_type)
+    )
+
+
+class ErrorLog(Sequence):
+    """
+    Validation errors stored column-wise.
+
+    Each error is kept as one entry in four parallel lists instead of one dict
+    per error. Indexing and iteration still return {"row", "field", "value",
+    "error"} dicts for callers that want records.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[int] = []
+        self.fields: list[str] = []
+        self.values: list[Any] = []
+        self.messages: list[str] = []
+
+    def add(self, row: int, field: str, value: Any, error: str) -> None:
+        """Record a single validation error."""
+        self.rows.append(row)
+        self.fields.append(field)
+        self.values.append(value)
+        self.messages.append(error)
+
+    def add_many(self, values: pd.Series, field: str, error: str) -> None:
+        """Record the same error for every value in a series, keyed by its index."""
+        self.rows.extend(values.index.tolist())
+        self.values.extend(values.tolist())
+        self.fields.extend([field] * len(values))
+        self.messages.extend([error] * len(values))
+
+    def extend(self, other: "ErrorLog") -> None:
+        """Append all errors from another log."""
+        self.rows.extend(other.rows)
+        self.fields.extend(other.fields)
+        self.values.extend(other.values)
+        self.messages.extend(other.messages)
+
+    def save_csv(self, output_path: Path, row_offset: int = 0) -> None:
+        """
+        Write all errors to a CSV file.
+
+        Args:
+            output_path: Path to output CSV file
+            row_offset: Added to each row index, e.g. 2 for 1-based file lines
+        """
+        table = pa.table(
+            {
+                "row": pa.array(self.rows, type=pa.int64()),
+                "field": pa.array(self.fields, type=pa.string()),
+                "value": pa.array([str(value) for value in self.values], type=pa.string()),
+                "error": pa.array(self.messages, type=pa.string()),
+            }
+        )
+        if row_offset:
+            table = table.set_column(0, "row", pc.add(table["row"], row_offset))
+        pa_csv.write_csv(table, output_path)
+
+    def _record(self, i: int) -> dict:
+        return {
+            "row": self.rows[i],
+            "field": self.fields[i],
+            "value": self.values[i],
+            "error": self.messages[i],
+        }
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(len(self)))]
+        return self._record(range(len(self))[index])
+
+
+def _transform_chunk(
+    config: TransformConfig, chunk: pd.DataFrame
+) -> tuple[pd.DataFrame, ErrorLog]:
+    """
+    Run the pipeline steps on one chunk in a worker process.
+
+    Args:
+        config: Transformation configuration
+        chunk: Chunk of input rows
+
+    Returns:
+        Transformed chunk and the validation errors found in it
+    """
+    transformer = StudentDataTransformer(config)
+    transformer.df = chunk
+    transformer.run_pipeline_steps()
+    if transformer.df is None:
+        raise TransformationError("Dataframe not found after transformation pipeline.")
+    return transformer.df, transformer.errors
 
 
 class StudentDataTransformer:
@@ -33,13 +250,146 @@ class StudentDataTransformer:
         """
         self.config = config or TransformConfig()
         self.df: Optional[pd.DataFrame] = None
-        self.errors: list[dict] = []
+        self.errors = ErrorLog()
         self.input_row_count: int = 0
+        self.input_bytes_read: int = 0
+
+    def reset(self, config: Optional[TransformConfig] = None) -> None:
+        """
+        Clear data and errors left by a previous run.
+
+        Args:
+            config: New configuration. Keeps the current one if not provided.
+        """
+        if config is not None:
+            self.config = config
+        self.df = None
+        self.errors = ErrorLog()
+        self.input_row_count = 0
+        self.input_bytes_read = 0
+
+    def _parse_csv(self, file_path: Path) -> pa.Table:
+        """
+        Parse CSV file into an Arrow table.
+
+        With preview_rows set, the file is read block by block and parsing
+        stops once enough rows have been read.
+
+        Args:
+            file_path: Path to input CSV file
+
+        Returns:
+            Parsed table
+        """
+        read_options, parse_options, convert_options = self._arrow_csv_options(
+            dict.fromkeys(TEXT_INPUT_COLUMNS, pa.string())
+        )
+
+        preview_rows = self.config.preview_rows
+        if preview_rows is None:
+            return pa_csv.read_csv(
+                file_path,
+                read_options=read_options,
+                parse_options=parse_options,
+                convert_options=convert_options,
+            )
+
+        batches = []
+        row_count = 0
+        with pa_csv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        ) as reader:
+            for batch in reader:
+                batches.append(batch)
+                row_count += batch.num_rows
+                if row_count >= preview_rows:
+                    break
+            schema = reader.schema
+        return pa.Table.from_batches(batches, schema=schema).slice(0, preview_rows)
+
+    def _arrow_csv_options(
+        self, column_types: dict[str, pa.DataType]
+    ) -> tuple[pa_csv.ReadOptions, pa_csv.ParseOptions, pa_csv.ConvertOptions]:
+        """
+        Build Arrow's CSV reader options from the configuration.
+
+        Args:
+            column_types: Types of the columns that must not be inferred
+
+        Returns:
+            Read, parse and convert options for pyarrow.csv
+        """
+        read_options = pa_csv.ReadOptions(
+            block_size=CSV_BLOCK_SIZE,
+            encoding=_arrow_encoding(self.config.input_encoding),
+        )
+        parse_options = pa_csv.ParseOptions(delimiter=self.config.csv_separator)
+        # Match pandas: empty fields are missing values, not ""
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types, strings_can_be_null=True
+        )
+        return read_options, parse_options, convert_options
+
+    def read_table(self, file_path: Path) -> pa.Table:
+        """
+        Parse CSV file, going through the Feather cache when enabled.
+
+        The cache sits next to the input as a hidden file keyed by the input's
+        size and modification time and by the parsing options (separator and
+        encoding), so editing the CSV or changing those options invalidates
+        it. It is written uncompressed so later runs memory-map it without
+        decoding.
+        Cache failures are logged and fall back to parsing the CSV.
+
+        Args:
+            file_path: Path to input CSV file
+
+        Returns:
+            Parsed table
+        """
+        # A preview only reads the head of the file, so it is never cached
+        if not self.config.cache_parsed_csv or self.config.preview_rows is not None:
+            return self._parse_csv(file_path)
+
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        options = f"{self.config.csv_separator}|{self.config.input_encoding}"
+        options_key = zlib.crc32(options.encode())
+        cache_path = file_path.with_name(
+            f".{file_path.name}.{stat.st_size}-{stat.st_mtime_ns}-{options_key:08x}.feather"
+        )
+        if cache_path.exists():
+            try:
+                table = feather.read_table(cache_path, memory_map=True)
+                logger.info(f"Loaded parsed CSV from cache {cache_path}")
+                return table
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+        table = self._parse_csv(file_path)
+        try:
+            # The name is escaped so brackets or wildcards in it match literally;
+            # the key check skips caches of longer names such as a.csv.bak.csv
+            prefix = f".{file_path.name}."
+            for stale in file_path.parent.glob(f"{glob.escape(prefix)}*.feather"):
+                if "." not in stale.name[len(prefix) : -len(".feather")]:
+                    stale.unlink()
+            feather.write_feather(table, cache_path, compression="uncompressed")
+            logger.debug(f"Wrote parsed CSV cache {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write cache {cache_path}: {e}")
+        return table
 
     def load_csv(self, file_path: Path) -> None:
         """
         Load CSV file into dataframe.
 
+        Uses Arrow's multithreaded parser unless config.csv_engine is "pandas",
+        which trades speed for pandas' more lenient parsing.
+
         Args:
             file_path: Path to input CSV file
 
@@ -48,16 +398,145 @@ class StudentDataTransformer:
         """
         try:
             logger.info(f"Loading CSV from {file_path}")
-            self.df = pd.read_csv(
-                file_path,
-                sep=self.config.csv_separator,
-                encoding=self.config.input_encoding,
-            )
+            if self.config.csv_engine == "pandas":
+                self.df = pd.read_csv(
+                    file_path,
+                    sep=self.config.csv_separator,
+                    encoding=self.config.input_encoding,
+                    dtype=dict.fromkeys(TEXT_INPUT_COLUMNS, str),
+                    nrows=self.config.preview_rows,
+                )
+            else:
+                self.df = _table_to_pandas(self.read_table(file_path))
             self.input_row_count = len(self.df)
             logger.info(f"Loaded {self.input_row_count} rows and {len(self.df.columns)} columns")
         except Exception as e:
             raise FileProcessingError(f"Failed to read CSV file: {e}") from e
 
+    def iter_csv_chunks(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file in chunks of rows.
+
+        Chunks keep a running row index, so error rows refer to the whole file,
+        and input_bytes_read tracks how far into the file reading has got.
+        Rows are streamed through Arrow's CSV reader, which fixes column types
+        from the first block and fails if a later block disagrees, so every
+        column is read as text: chunks get the same types whatever their
+        values. With the Feather cache enabled, the whole file is parsed (or
+        mapped from the cache) once and sliced into chunks instead. With
+        config.csv_engine set to "pandas", pandas reads the chunks and the
+        cache is not used, as in load_csv.
+
+        Args:
+            file_path: Path to input CSV file
+            chunk_size: Maximum number of rows per chunk
+
+        Yields:
+            Dataframe holding the next chunk of rows
+
+        Raises:
+            FileProcessingError: If file cannot be read
+        """
+        try:
+            logger.info(f"Streaming CSV from {file_path} in chunks of {chunk_size} rows")
+            if self.config.csv_engine == "pandas":
+                yield from self._iter_pandas_chunks(file_path, chunk_size)
+                return
+
+            if self.config.cache_parsed_csv:
+                table = self.read_table(file_path)
+                file_size = Path(file_path).stat().st_size
+                # An input without rows still gives one empty chunk, as below
+                for start in range(0, max(table.num_rows, 1), chunk_size):
+                    chunk = self._next_chunk(table.slice(start, chunk_size))
+                    self.input_bytes_read = (
+                        file_size * self.input_row_count // max(table.num_rows, 1)
+                    )
+                    yield chunk
+                return
+
+            column_names = self._read_column_names(file_path)
+            read_options, parse_options, convert_options = self._arrow_csv_options(
+                dict.fromkeys(column_names, pa.string())
+            )
+            preview_rows = self.config.preview_rows
+            with (
+                open(file_path, "rb") as handle,
+                pa_csv.open_csv(
+                    handle,
+                    read_options=read_options,
+                    parse_options=parse_options,
+                    convert_options=convert_options,
+                ) as reader,
+            ):
+                # Arrow's blocks hold a fixed number of bytes, not rows, so they
+                # are buffered and regrouped into chunks of chunk_size rows
+                buffered: list[pa.RecordBatch] = []
+                buffered_rows = 0
+                for batch in reader:
+                    if preview_rows is not None:
+                        batch = batch.slice(0, preview_rows - self.input_row_count - buffered_rows)
+                    buffered.append(batch)
+                    buffered_rows += batch.num_rows
+                    while buffered_rows >= chunk_size:
+                        table = pa.Table.from_batches(buffered, schema=reader.schema)
+                        buffered = table.slice(chunk_size).to_batches()
+                        buffered_rows -= chunk_size
+                        chunk = self._next_chunk(table.slice(0, chunk_size))
+                        # The reader reads ahead in blocks, so this runs slightly ahead
+                        self.input_bytes_read = handle.tell()
+                        yield chunk
+                    read_rows = self.input_row_count + buffered_rows
+                    if preview_rows is not None and read_rows >= preview_rows:
+                        break
+                # An input without rows still gives one (empty) chunk, so the
+                # output gets its header
+                if buffered_rows or self.input_row_count == 0:
+                    chunk = self._next_chunk(pa.Table.from_batches(buffered, schema=reader.schema))
+                    self.input_bytes_read = handle.tell()
+                    yield chunk
+        except Exception as e:
+            raise FileProcessingError(f"Failed to read CSV file: {e}") from e
+
+    def _iter_pandas_chunks(self, file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read CSV file in chunks with pandas, parsing TEXT_INPUT_COLUMNS as text."""
+        with (
+            open(file_path, "rb") as handle,
+            pd.read_csv(
+                handle,
+                sep=self.config.csv_separator,
+                encoding=self.config.input_encoding,
+                dtype=dict.fromkeys(TEXT_INPUT_COLUMNS, str),
+                chunksize=chunk_size,
+                nrows=self.config.preview_rows,
+            ) as reader,
+        ):
+            for chunk in reader:
+                self.input_row_count += len(chunk)
+                # The parser reads ahead in blocks, so this runs slightly ahead
+                self.input_bytes_read = handle.tell()
+                logger.debug(f"Loaded chunk of {len(chunk)} rows")
+                yield chunk
+
+    def _read_column_names(self, file_path: Path) -> list[str]:
+        """Read the column names from the CSV header with Arrow's reader."""
+        read_options, parse_options, convert_options = self._arrow_csv_options({})
+        with pa_csv.open_csv(
+            file_path,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        ) as reader:
+            return reader.schema.names
+
+    def _next_chunk(self, table: pa.Table) -> pd.DataFrame:
+        """Convert the next rows of the input to a chunk, continuing the row index."""
+        chunk = _table_to_pandas(table)
+        chunk.index = pd.RangeIndex(self.input_row_count, self.input_row_count + len(chunk))
+        self.input_row_count += len(chunk)
+        logger.debug(f"Loaded chunk of {len(chunk)} rows")
+        return chunk
+
     def validate_input_columns(self) -> None:
         """
         Validate that required input columns exist.
@@ -92,9 +571,7 @@ class StudentDataTransformer:
             return
 
         logger.debug("Cleaning addresses")
-        self.df["Direccion"] = self.df["Direccion"].apply(
-            lambda x: clean_address(x) if pd.notna(x) else ""
-        )
+        self.df["Direccion"] = clean_addresses(self.df["Direccion"])
 
     def format_ruts(self) -> None:
         """Combine RUT number with check digit."""
@@ -111,18 +588,10 @@ class StudentDataTransformer:
 
         # Validate RUTs if configured
         if self.config.validate_rut:
-            invalid_ruts = []
-            for idx, rut in self.df["Rut"].items():
-                if not validate_rut(str(rut)):
-                    invalid_ruts.append((idx, rut))
-                    self.errors.append({
-                        "row": idx,
-                        "field": "Rut",
-                        "value": rut,
-                        "error": "Invalid RUT check digit"
-                    })
-
-            if invalid_ruts:
+            invalid_ruts = self.df["Rut"][~validate_ruts(self.df["Rut"])]
+            self.errors.add_many(invalid_ruts, "Rut", "Invalid RUT check digit")
+
+            if len(invalid_ruts):
                 logger.warning(f"Found {len(invalid_ruts)} invalid RUTs")
 
     def split_names(self) -> None:
@@ -133,26 +602,39 @@ class StudentDataTransformer:
         logger.debug("Splitting names")
 
         # Split student names
-        names = self.df["Nombres"].str.split(" ", n=1, expand=True)
-        self.df["Primer Nombre Alumno"] = names[0]
-        self.df["Segundo Nombre Alumno"] = names[1] if 1 in names.columns else None
-        self.df.drop(columns=["Nombres"], inplace=True)
+        self._split_name_column("Nombres", "Primer Nombre Alumno", "Segundo Nombre Alumno")
 
         # Split guardian names
         if "Nombre Apoderado" in self.df.columns:
-            guardian_names = self.df["Nombre Apoderado"].str.split(" ", n=1, expand=True)
-            self.df["Primer Nombre Apoderado"] = guardian_names[0]
-            self.df["Segundo Nombre Apoderado"] = guardian_names[1] if 1 in guardian_names.columns else None
-            self.df.drop(columns=["Nombre Apoderado"], inplace=True)
+            self._split_name_column(
+                "Nombre Apoderado", "Primer Nombre Apoderado", "Segundo Nombre Apoderado"
+            )
 
         # Split second guardian names
         if "Nombre Apoderado SPL" in self.df.columns:
             # Convert to string and handle NaN values
             self.df["Nombre Apoderado SPL"] = self.df["Nombre Apoderado SPL"].fillna("").astype(str)
-            guardian2_names = self.df["Nombre Apoderado SPL"].str.split(" ", n=1, expand=True)
-            self.df["Primer Nombre Apoderado SPL"] = guardian2_names[0]
-            self.df["Segundo Nombre Apoderado SPL"] = guardian2_names[1] if 1 in guardian2_names.columns else None
-            self.df.drop(columns=["Nombre Apoderado SPL"], inplace=True)
+            self._split_name_column(
+                "Nombre Apoderado SPL", "Primer Nombre Apoderado SPL", "Segundo Nombre Apoderado SPL"
+            )
+
+    def _split_name_column(self, col: str, first_col: str, second_col: str) -> None:
+        """
+        Split a full-name column at the first space and drop it.
+
+        The column is read as text first, since a chunk of blank names is
+        parsed as floats. partition yields three columns (first, separator,
+        rest) unless every name is missing, so they are filled in; rows
+        without a space get no second name, as with split(" ", n=1).
+        """
+        if self.df is None:
+            return
+
+        names = self.df[col].astype("string")
+        parts = names.str.partition(" ").reindex(columns=range(3)).astype("string")
+        self.df[first_col] = parts[0]
+        self.df[second_col] = parts[2].where(parts[1] != "")
+        self.df.drop(columns=[col], inplace=True)
 
     def create_course_codes(self) -> None:
         """Create course codes by combining grade and letter."""
@@ -170,7 +652,9 @@ class StudentDataTransformer:
             return
 
         logger.debug("Mapping commune codes")
-        self.df["Comuna"] = self.df["Comuna"].replace(COMUNA_CODES)
+        # Few distinct communes: map each category once instead of every row
+        comunas = self.df["Comuna"].astype("category")
+        self.df["Comuna"] = comunas.map(_comuna_name).astype(str)
 
     def create_full_addresses(self) -> None:
         """Combine address with commune."""
@@ -202,7 +686,7 @@ class StudentDataTransformer:
                 ).dt.date
 
     def clean_phone_numbers(self) -> None:
-        """Clean and format phone numbers."""
+        """Clean and format phone numbers, setting invalid ones to 0."""
         if self.df is None:
             return
 
@@ -213,68 +697,19 @@ class StudentDataTransformer:
             if col not in self.df.columns:
                 continue
 
-            # Process each phone number
-            cleaned_phones = []
-            for idx in self.df.index:
-                phone = self.df.at[idx, col]
-
-                # Handle NaN/None/empty
-                if pd.isna(phone) or phone == "" or phone is None:
-                    cleaned_phones.append(0)
-                    continue
-
-                # Convert to string
-                phone_str = str(phone).strip()
-
-                # Handle float notation (e.g., "932832346.0" -> "932832346")
-                if "." in phone_str:
-                    try:
-                        # Convert to float then to int to remove decimal part
-                        phone_str = str(int(float(phone_str)))
-                    except (ValueError, OverflowError):
-                        pass
-
-                # Remove spaces, hyphens, and other common separators
-                phone_str = phone_str.replace(" ", "").replace("-", "").replace("+56", "")
-
-                # Remove non-digit characters
-                phone_str = "".join(c for c in phone_str if c.isdigit())
-
-                # If empty after cleaning, set to 0
-                if not phone_str:
-                    cleaned_phones.append(0)
-                    continue
-
-                # Convert to integer
-                phone_int = int(phone_str)
-
-                # Validate: 0 is valid (empty phone)
-                if phone_int == 0:
-                    cleaned_phones.append(0)
-                    continue
-
-                # Validate Chilean phone format (9 digits)
-                # Mobile: starts with 9 (900000000-999999999)
-                # Fixed: starts with 2,3,4,5,6,7 (200000000-799999999)
-                is_mobile = 900000000 <= phone_int <= 999999999
-                is_fixed = 200000000 <= phone_int <= 799999999
-
-                if is_mobile or is_fixed:
-                    cleaned_phones.append(phone_int)
-                else:
-                    # Invalid phone (wrong format)
-                    # Log warning and set to 0 to maintain data integrity
-                    logger.warning(f"Row {idx}: Invalid phone in {col}: {phone} (cleaned: {phone_int}) -> setting to 0")
-                    self.errors.append({
-                        "row": idx,
-                        "field": col,
-                        "value": phone,
-                        "error": f"Invalid phone: must be 9 digits (mobile 9XX... or fixed 2-7XX...)"
-                    })
-                    cleaned_phones.append(0)
-
-            # Update column with cleaned phones as integers (Int64 to handle 0 properly)
-            self.df[col] = pd.array(cleaned_phones, dtype="Int64")
+            cleaned = clean_phones(self.df[col])
+            invalid = cleaned.isna()
+
+            # Invalid phones are logged and set to 0 to maintain data integrity
+            self.errors.add_many(
+                self.df[col][invalid],
+                col,
+                "Invalid phone: must be 9 digits (mobile 9XX... or fixed 2-7XX...)",
+            )
+            if invalid.any():
+                logger.warning(f"Found {invalid.sum()} invalid phones in {col}, set to 0")
+
+            self.df[col] = cleaned.fillna(0)
 
     def add_metadata_columns(self) -> None:
         """Add RBD, year, nivel, and local columns."""
@@ -283,15 +718,16 @@ class StudentDataTransformer:
 
         logger.debug("Adding metadata columns")
 
+        # Grade levels based on Grado column ("" for grades without a level);
+        # grades are read as text, so they are looked up by number
+        grades = pd.to_numeric(self.df["Grado"], errors="coerce")
+        levels = grades.map(GRADE_LEVELS).fillna("").astype(str)
+
         self.df.insert(0, "rbd", self.config.rbd)
         self.df.insert(1, "year", self.config.year)
-        self.df.insert(2, "Nivel", "")
+        self.df.insert(2, "Nivel", levels)
         self.df.insert(3, "local", self.config.local)
 
-        # Set grade levels based on Grado column
-        for grade, level in GRADE_LEVELS.items():
-            self.df.loc[self.df["Grado"] == grade, "Nivel"] = level
-
     def uppercase_addresses(self) -> None:
         """Convert addresses to uppercase."""
         if self.df is None:
@@ -336,19 +772,33 @@ class StudentDataTransformer:
         email_columns = ["estudianteEmail", "tutor1Email", "tutor2Email"]
         for col in email_columns:
             if col in self.df.columns:
-                for idx, email in self.df[col].items():
-                    if pd.notna(email) and email and not validate_email(str(email)):
-                        self.errors.append({
-                            "row": idx,
-                            "field": col,
-                            "value": email,
-                            "error": "Invalid email format"
-                        })
-                        email_error_count += 1
+                # Empty emails are allowed; only check the ones that are filled in
+                emails = self.df[col].dropna()
+                emails = emails[emails.astype(bool)]
+                invalid_emails = emails[~validate_emails(emails)]
+                self.errors.add_many(invalid_emails, col, "Invalid email format")
+                email_error_count += len(invalid_emails)
 
         if email_error_count > 0:
             logger.warning(f"Found {email_error_count} email validation errors")
 
+    def run_pipeline_steps(self) -> None:
+        """Run every pipeline step after loading on the current dataframe."""
+        self.validate_input_columns()
+        self.clean_addresses()
+        self.uppercase_addresses()
+        self.format_ruts()
+        self.split_names()
+        self.create_course_codes()
+        self.map_comuna_codes()
+        self.create_full_addresses()
+        self.add_metadata_columns()
+        self.convert_dates()
+        self.clean_phone_numbers()
+        self.rename_columns()
+        self.reorder_columns()
+        self.validate_emails()
+
     def transform(self, input_path: Path) -> pd.DataFrame:
         """
         Execute full transformation pipeline.
@@ -364,22 +814,10 @@ class StudentDataTransformer:
         """
         try:
             logger.info("Starting transformation pipeline")
+            self.reset()
 
             self.load_csv(input_path)
-            self.validate_input_columns()
-            self.clean_addresses()
-            self.uppercase_addresses()
-            self.format_ruts()
-            self.split_names()
-            self.create_course_codes()
-            self.map_comuna_codes()
-            self.create_full_addresses()
-            self.add_metadata_columns()
-            self.convert_dates()
-            self.clean_phone_numbers()
-            self.rename_columns()
-            self.reorder_columns()
-            self.validate_emails()
+            self.run_pipeline_steps()
 
             logger.info("Transformation completed successfully")
 
@@ -396,12 +834,176 @@ class StudentDataTransformer:
         except Exception as e:
             raise TransformationError(f"Transformation failed: {e}") from e
 
-    def save_csv(self, output_path: Path) -> None:
+    def transform_stream(
+        self, input_path: Path, chunk_size: Optional[int] = None, workers: int = 1
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Execute the transformation pipeline chunk by chunk.
+
+        Only one chunk is held in memory at a time. Validation errors and the
+        input row count accumulate across chunks and are cleared when a new
+        run starts.
+
+        Args:
+            input_path: Path to input CSV file
+            chunk_size: Maximum number of rows per chunk. Defaults to config.chunk_size.
+            workers: Number of processes transforming chunks in parallel
+
+        Yields:
+            Transformed dataframe for each chunk (also left in self.df)
+
+        Raises:
+            TransformationError: If transformation fails
+        """
+        try:
+            logger.info("Starting streaming transformation pipeline")
+            self.reset()
+
+            chunks = self.iter_csv_chunks(input_path, chunk_size or self.config.chunk_size)
+            if workers > 1:
+                yield from self._transform_chunks_parallel(chunks, workers)
+            else:
+                for chunk in chunks:
+                    self.df = chunk
+                    self.run_pipeline_steps()
+                    yield self.df
+
+            logger.info("Transformation completed successfully")
+
+            if self.errors:
+                logger.warning(f"Transformation completed with {len(self.errors)} validation warnings")
+
+        except Exception as e:
+            raise TransformationError(f"Transformation failed: {e}") from e
+
+    def transform_to_csv(self, input_path: Path, output_path: Path, workers: int = 1) -> int:
+        """
+        Transform a CSV file chunk by chunk, appending each chunk to the output.
+
+        Memory use is bounded by config.chunk_size rather than the file size.
+        Chunks go to a temporary file that replaces output_path once every
+        chunk is written, so a failure leaves no partial output.
+
+        Args:
+            input_path: Path to input CSV file
+            output_path: Path to output CSV file
+            workers: Number of processes transforming chunks in parallel
+
+        Returns:
+            Number of input rows processed
+
+        Raises:
+            TransformationError: If transformation fails
+            FileProcessingError: If the output file cannot be written
+        """
+        with atomic_output(output_path) as partial_path:
+            for i, _ in enumerate(self.transform_stream(input_path, workers=workers)):
+                self.save_csv(partial_path, append=i > 0)
+        return self.input_row_count
+
+    def _transform_chunks_parallel(
+        self, chunks: Iterable[pd.DataFrame], workers: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Transform chunks in a process pool, yielding them in input order.
+
+        At most two chunks per worker are in flight, so memory stays bounded
+        as in the sequential path. Workers are spawned rather than forked,
+        since Arrow's thread pools are already running in this process.
+        Workers do not configure logging, so their log messages are dropped.
+
+        Args:
+            chunks: Chunks of input rows
+            workers: Number of worker processes
+
+        Yields:
+            Transformed dataframe for each chunk (also left in self.df)
+        """
+        logger.info(f"Transforming chunks in {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            pending: deque[Future] = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_transform_chunk, self.config, chunk))
+                if len(pending) >= 2 * workers:
+                    yield self._collect_chunk(pending.popleft())
+            while pending:
+                yield self._collect_chunk(pending.popleft())
+
+    def _collect_chunk(self, future: Future) -> pd.DataFrame:
+        """Merge a worker's transformed chunk and errors into this transformer."""
+        self.df, errors = future.result()
+        self.errors.extend(errors)
+        return self.df
+
+    def _write_csv_arrow(self, output_path: Path, append: bool) -> bool:
+        """
+        Write the dataframe with Arrow's CSV writer when it matches pandas.
+
+        Values are written unquoted, as pandas does when no quoting is needed.
+        If any value holds the separator, a quote or a newline, Arrow refuses
+        to write it unquoted and the caller falls back to pandas. The chunk is
+        encoded in memory first, so a refused chunk leaves the file untouched.
+
+        Args:
+            output_path: Path to output CSV file
+            append: If True, append rows without header
+
+        Returns:
+            True if the file was written, False if pandas should write it
+        """
+        if self.df is None:
+            return False
+        encoding = codecs.lookup(self.config.output_encoding).name
+        if encoding not in ("utf-8", "utf-8-sig"):
+            return False
+
+        try:
+            table = pa.Table.from_pandas(self.df, preserve_index=False)
+            # Columns with no values at all (e.g. an empty float column read
+            # from blank cells) are written as empty fields by both writers
+            if not all(
+                _formats_like_pandas(column.type) or column.null_count == len(column)
+                for column in table.columns
+            ):
+                return False
+            sink = pa.BufferOutputStream()
+            pa_csv.write_csv(
+                table,
+                sink,
+                pa_csv.WriteOptions(
+                    include_header=not append,
+                    delimiter=self.config.csv_separator,
+                    quoting_style="none",
+                    quoting_header="none",
+                ),
+            )
+        # TypeError: pyarrow before 22 has no quoting_header option, and its
+        # quoted header would not match pandas
+        except (
+            TypeError,
+            pa.ArrowInvalid,
+            pa.ArrowTypeError,
+            pa.ArrowNotImplementedError,
+        ) as e:
+            logger.debug(f"Writing with pandas instead of Arrow: {e}")
+            return False
+
+        with open(output_path, "ab" if append else "wb") as handle:
+            if encoding == "utf-8-sig" and not append:
+                handle.write(codecs.BOM_UTF8)
+            handle.write(sink.getvalue())
+        return True
+
+    def save_csv(self, output_path: Path, append: bool = False) -> None:
         """
         Save transformed data to CSV.
 
         Args:
             output_path: Path to output CSV file
+            append: If True, append rows without header (for streamed chunks)
 
         Raises:
             FileProcessingError: If file cannot be written
@@ -411,12 +1013,17 @@ class StudentDataTransformer:
 
         try:
             logger.info(f"Saving output to {output_path}")
-            self.df.to_csv(
-                output_path,
-                sep=self.config.csv_separator,
-                index=False,
-                encoding=self.config.output_encoding,
-            )
+            if not self._write_csv_arrow(output_path, append):
+                self.df.to_csv(
+                    output_path,
+                    sep=self.config.csv_separator,
+                    index=False,
+                    encoding=self.config.output_encoding,
+                    mode="a" if append else "w",
+                    header=not append,
+                    # Same line endings as the Arrow writer on every platform
+                    lineterminator="\n",
+                )
             logger.info(f"Saved {len(self.df)} rows to {output_path}")
         except Exception as e:
             raise FileProcessingError(f"Failed to write CSV file: {e}") from e
@@ -1,8 +1,43 @@
 """Custom validators for Chilean-specific data formats."""
 
 import re
+import unicodedata
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
+# Check digit for each remainder of the weighted sum mod 11 (11 - r, 11->0, 10->K)
+_RUT_DV_CHARS = "0K987654321"
+_RUT_DV_BY_REMAINDER = np.array(list(_RUT_DV_CHARS))
+
+# Cyclic weights applied to RUT digits from right to left (up to 9 digits)
+_RUT_WEIGHTS = (2, 3, 4, 5, 6, 7, 2, 3, 4)
+
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# City names removed from addresses, fused into one alternation so each address
+# is scanned once. Alternatives are tried in order, which matches applying them
+# one after another; "la  serena" is left out because "serena" is removed first
+_CITY_RE = re.compile(
+    "|".join(
+        rf"\b{name}\b"
+        for name in ("la serena", "laserena", "serena", "laserna", "coquimbo", "vicuña")
+    ),
+    re.IGNORECASE,
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Explicit ASCII classes: \d and \D also cover other Unicode digits in Python's
+# re but not in Arrow's regex engine, so clean_phones spells digits in ASCII first
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+# Mobile: 9 digits starting with 9; fixed: 9 digits starting with 2-7
+_PHONE_RE = re.compile(r"[2-79][0-9]{8}")
+
+_NINE_DIGITS_RE = re.compile(r"^\d{9}$")
+
 
 def validate_rut(rut: str) -> bool:
     """
@@ -25,8 +60,11 @@ def validate_rut(rut: str) -> bool:
     # Remove dots and hyphens
     clean_rut = rut.replace(".", "").replace("-", "").upper().strip()
 
-    # Check format: digits + optional K
-    if not re.match(r"^\d{7,9}[0-9K]$", clean_rut):
+    # Check format: 7-9 digits + check digit (0-9 or K); isdecimal matches
+    # the same characters as \d, without entering the regex engine
+    if not 8 <= len(clean_rut) <= 10 or clean_rut[-1] not in _RUT_DV_CHARS:
+        return False
+    if not clean_rut[:-1].isdecimal():
         return False
 
     # Split RUT and check digit
@@ -40,22 +78,72 @@ def validate_rut(rut: str) -> bool:
         # IPE: Accept without check digit validation
         return True
 
-    # Regular RUT: Calculate expected check digit
-    reversed_digits = map(int, reversed(rut_digits))
-    factors = [2, 3, 4, 5, 6, 7]
+    # Regular RUT: weight digits from right to left with integer arithmetic,
+    # the scalar form of rut_check_digits
+    total = 0
+    remaining = rut_number
+    for weight in _RUT_WEIGHTS:
+        total += (remaining % 10) * weight
+        remaining //= 10
 
-    s = sum(d * factors[i % 6] for i, d in enumerate(reversed_digits))
-    remainder = s % 11
-    expected_digit = 11 - remainder
+    return check_digit == _RUT_DV_CHARS[total % 11]
 
-    if expected_digit == 11:
-        expected_digit_str = "0"
-    elif expected_digit == 10:
-        expected_digit_str = "K"
-    else:
-        expected_digit_str = str(expected_digit)
 
-    return check_digit == expected_digit_str
+def rut_check_digits(numbers: np.ndarray) -> np.ndarray:
+    """
+    Compute expected check digits for an array of RUT numbers.
+
+    Args:
+        numbers: Integer array of RUT numbers without check digit (up to 9 digits)
+
+    Returns:
+        Array of expected check digits ("0"-"9" or "K")
+    """
+    remaining = numbers.astype(np.int64)
+    total = np.zeros_like(remaining)
+    for weight in _RUT_WEIGHTS:
+        total += (remaining % 10) * weight
+        remaining //= 10
+    return _RUT_DV_BY_REMAINDER[total % 11]
+
+
+def validate_ruts(ruts: pd.Series) -> pd.Series:
+    """
+    Validate a column of RUTs at once.
+
+    Same rules as validate_rut, computed with vectorized string and NumPy
+    operations instead of one Python call per row.
+
+    Args:
+        ruts: Series of RUT strings in format "12345678-9" or "12345678-K"
+
+    Returns:
+        Boolean series, True where the RUT is valid
+    """
+    clean = (
+        ruts.astype(str)
+        .str.replace(".", "", regex=False)
+        .str.replace("-", "", regex=False)
+        .str.upper()
+        .str.strip()
+    )
+    # Other Unicode decimal digits (e.g. full-width) are digits to int(), as
+    # validate_rut accepts them; rewrite them in ASCII, since the Python and
+    # Arrow regex engines disagree on whether \d matches them
+    non_ascii = clean.str.contains(r"[^\x00-\x7f]", regex=True).fillna(False)
+    non_ascii = non_ascii.to_numpy(dtype=bool)
+    if non_ascii.any():
+        clean[non_ascii] = clean[non_ascii].map(_to_ascii_digits)
+    valid = clean.str.fullmatch(r"[0-9]{7,9}[0-9K]").fillna(False).astype(bool)
+
+    candidates = clean[valid]
+    numbers = candidates.str[:-1].astype(np.int64).to_numpy()
+    check_digits = candidates.str[-1].to_numpy(dtype=str)
+
+    # IPEs (100 and 200 million ranges) are accepted without check digit validation
+    is_ipe = (numbers >= 100000000) & (numbers < 300000000)
+    valid.loc[candidates.index] = is_ipe | (check_digits == rut_check_digits(numbers))
+    return valid
 
 
 def format_rut(rut: str, dv: str) -> str:
@@ -85,8 +173,20 @@ def validate_email(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
+
+
+def validate_emails(emails: pd.Series) -> pd.Series:
+    """
+    Validate a column of email addresses at once.
+
+    Args:
+        emails: Series of email address strings
+
+    Returns:
+        Boolean series, True where the email format is valid
+    """
+    return emails.astype(str).str.match(_EMAIL_RE).fillna(False).astype(bool)
 
 
 def validate_phone(phone: Any) -> bool:
@@ -107,22 +207,97 @@ def validate_phone(phone: Any) -> bool:
     if phone is None or phone == 0:
         return True  # Allow empty phones
 
-    phone_str = str(phone).strip()
+    if isinstance(phone, int) and not isinstance(phone, bool):
+        # Integers are compared directly; the sign is ignored, as the string
+        # path drops it together with the other hyphens
+        phone_int = abs(phone)
+    else:
+        phone_str = str(phone).strip()
 
-    # Remove common separators
-    phone_str = phone_str.replace(" ", "").replace("-", "").replace("+56", "")
+        # Remove common separators
+        phone_str = phone_str.replace(" ", "").replace("-", "").replace("+56", "")
 
-    # Must be exactly 9 digits
-    if not re.match(r"^\d{9}$", phone_str):
-        return False
+        # Must be exactly 9 digits
+        if not _NINE_DIGITS_RE.match(phone_str):
+            return False
 
-    phone_int = int(phone_str)
+        phone_int = int(phone_str)
 
     # Mobile: starts with 9 (900000000-999999999)
     # Fixed: starts with 2-7 (200000000-799999999)
     return (900000000 <= phone_int <= 999999999) or (200000000 <= phone_int <= 799999999)
 
 
+def _to_ascii_digits(text: str) -> str:
+    """Replace every Unicode decimal digit in text with its ASCII digit."""
+    return "".join(str(unicodedata.decimal(c)) if c.isdecimal() else c for c in text)
+
+
+def _is_valid_phone_number(numbers: np.ndarray) -> np.ndarray:
+    """Check cleaned phone numbers against the mobile and fixed ranges (0 is empty)."""
+    return (
+        (numbers == 0)
+        | ((numbers >= 200000000) & (numbers <= 799999999))
+        | ((numbers >= 900000000) & (numbers <= 999999999))
+    )
+
+
+def clean_phones(phones: pd.Series) -> pd.Series:
+    """
+    Clean a column of phone numbers at once.
+
+    Float notation (e.g. 932832346.0) is truncated, spaces, hyphens, +56 and
+    any other non-digit characters are removed, and missing or empty values
+    become 0. Numeric columns skip the string handling entirely.
+
+    Args:
+        phones: Series of raw phone numbers (numbers or strings)
+
+    Returns:
+        Int64 series of cleaned phones, 0 where empty and <NA> where the
+        number is not a valid mobile or fixed phone
+    """
+    if pd.api.types.is_numeric_dtype(phones) and not pd.api.types.is_bool_dtype(phones):
+        numbers = np.trunc(np.abs(phones.to_numpy(dtype="float64", na_value=0.0)))
+        numbers[~np.isfinite(numbers)] = 0
+        valid = _is_valid_phone_number(numbers)
+    else:
+        text = phones.astype("string").str.strip()
+
+        # Other Unicode decimal digits (e.g. full-width) are digits to int(),
+        # as validate_phone accepts them; rewrite them in ASCII
+        non_ascii = text.str.contains(r"[^\x00-\x7f]", regex=True).fillna(False)
+        non_ascii = non_ascii.to_numpy(dtype=bool)
+        if non_ascii.any():
+            text[non_ascii] = text[non_ascii].map(_to_ascii_digits)
+
+        # Float notation: "932832346.0" -> "932832346" (unparsable values are kept)
+        dotted = text.str.contains(".", regex=False).fillna(False).to_numpy(dtype=bool)
+        floats = pd.to_numeric(text[dotted], errors="coerce").to_numpy(
+            dtype="float64", na_value=np.nan
+        )
+        finite = np.isfinite(floats)
+        text.iloc[np.flatnonzero(dotted)[finite]] = np.char.mod(
+            "%.0f", np.abs(np.trunc(floats[finite]))
+        )
+
+        digits = (
+            text.str.replace(" ", "", regex=False)
+            .str.replace("-", "", regex=False)
+            .str.replace("+56", "", regex=False)
+            .str.replace(_NON_DIGIT_RE, "", regex=True)
+            .str.lstrip("0")
+            .fillna("")
+        )
+        filled = digits.str.fullmatch(_PHONE_RE).fillna(False).to_numpy(dtype=bool)
+        valid = filled | (digits == "").to_numpy(dtype=bool)
+        numbers = pd.to_numeric(digits.where(filled, "0")).to_numpy(dtype="float64")
+
+    numbers = np.where(valid, numbers, 0).astype(np.int64)
+    cleaned = pd.Series(pd.array(numbers, dtype="Int64"), index=phones.index)
+    return cleaned.mask(~valid)
+
+
 def clean_address(address: str) -> str:
     """
     Clean address by removing city names and extra whitespace.
@@ -137,24 +312,36 @@ def clean_address(address: str) -> str:
         return ""
 
     # Remove common city names
-    patterns = [
-        r"\bla serena\b",
-        r"\blaserena\b",
-        r"\bserena\b",
-        r"\blaserna\b",
-        r"\bla  serena\b",
-        r"\bcoquimbo\b",
-        r"\bvicuña\b",
-    ]
-
-    cleaned = address
-    for pattern in patterns:
-        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = _CITY_RE.sub("", address)
 
     # Remove commas
     cleaned = cleaned.replace(",", "")
 
-    # Clean up extra whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned).strip()
+    # Clean up extra whitespace: split() breaks on the same characters as \s
+    # and drops the ends, so this collapses runs without the regex engine
+    cleaned = " ".join(cleaned.split())
 
     return cleaned
+
+
+def clean_addresses(addresses: pd.Series) -> pd.Series:
+    """
+    Clean a column of addresses at once.
+
+    Same rules as clean_address, applied with vectorized string operations.
+    Compiled patterns keep Python regex semantics (e.g. \\s matching
+    non-breaking spaces) on Arrow-backed string columns.
+
+    Args:
+        addresses: Series of raw address strings
+
+    Returns:
+        Series of cleaned addresses ("" for missing or non-text values)
+    """
+    if pd.api.types.infer_dtype(addresses, skipna=True) != "string":
+        return pd.Series("", index=addresses.index, dtype=str)
+
+    cleaned = addresses.str.replace(_CITY_RE, "", regex=True)
+    cleaned = cleaned.str.replace(",", "", regex=False)
+    cleaned = cleaned.str.replace(_WHITESPACE_RE, " ", regex=True).str.strip()
+    return cleaned.fillna("")
@@ -2,12 +2,15 @@
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.csv as pa_csv
 import pytest
 
-from dobby.exceptions import FileProcessingError, MissingColumnError
-from dobby.models import TransformConfig
-from dobby.transformer import StudentDataTransformer
+from dobby.constants import OUTPUT_COLUMNS
+from dobby.exceptions import FileProcessingError, MissingColumnError, TransformationError
+from dobby.models import StudentOutputRecord, TransformConfig
+from dobby.transformer import ErrorLog, StudentDataTransformer
 
 
 @pytest.fixture
@@ -46,6 +49,40 @@ def sample_input_csv(tmp_path):
     return csv_path
 
 
+class TestErrorLog:
+    """Tests for ErrorLog class."""
+
+    def test_add_and_records(self):
+        """Test that errors are stored column-wise and read back as records."""
+        errors = ErrorLog()
+        errors.add(3, "Rut", "123-4", "Invalid RUT check digit")
+        errors.add_many(pd.Series(["a", "b"], index=[5, 7]), "tutor1Email", "Invalid email format")
+
+        assert len(errors) == 3
+        assert errors.rows == [3, 5, 7]
+        assert errors.fields == ["Rut", "tutor1Email", "tutor1Email"]
+        assert errors[-1] == {
+            "row": 7,
+            "field": "tutor1Email",
+            "value": "b",
+            "error": "Invalid email format",
+        }
+        assert [error["value"] for error in errors[:2]] == ["123-4", "a"]
+
+    def test_save_csv(self, tmp_path):
+        """Test that the full error log is written with offset row numbers."""
+        errors = ErrorLog()
+        errors.add(3, "Rut", "123-4", "Invalid RUT check digit")
+        errors.add(5, "tutor1Celular", 12345, "Invalid phone number")
+
+        output_path = tmp_path / "errors.csv"
+        errors.save_csv(output_path, row_offset=2)
+        saved = pd.read_csv(output_path)
+        assert saved["row"].tolist() == [5, 7]
+        assert saved["value"].tolist() == ["123-4", "12345"]
+        assert saved["error"].tolist() == ["Invalid RUT check digit", "Invalid phone number"]
+
+
 class TestStudentDataTransformer:
     """Tests for StudentDataTransformer class."""
 
@@ -55,6 +92,28 @@ class TestStudentDataTransformer:
         transformer.load_csv(sample_input_csv)
         assert transformer.df is not None
         assert len(transformer.df) == 2
+        # Text is Arrow-backed on every supported pandas version
+        assert transformer.df["Nombres"].dtype == pd.StringDtype("pyarrow", na_value=np.nan)
+
+    def test_load_csv_empty_fields_are_missing(self, sample_input_csv):
+        """Test that empty CSV fields load as missing values."""
+        transformer = StudentDataTransformer()
+        transformer.load_csv(sample_input_csv)
+        assert transformer.df is not None
+        assert transformer.df["Nombre Apoderado SPL"].isna().all()
+        assert transformer.df["Celular SPL"].isna().all()
+
+    def test_preview_rows(self, sample_input_csv):
+        """Test that only the first preview rows are read."""
+        config = TransformConfig(preview_rows=1)
+        transformer = StudentDataTransformer(config)
+        result = transformer.transform(sample_input_csv)
+        assert len(result) == 1
+        assert result["estudianteNombre1"].iloc[0] == "JUAN"
+
+        chunks = list(transformer.transform_stream(sample_input_csv, chunk_size=5))
+        assert [len(chunk) for chunk in chunks] == [1]
+        assert transformer.input_row_count == 1
 
     def test_load_csv_nonexistent_file(self, tmp_path):
         """Test loading non-existent file."""
@@ -103,6 +162,28 @@ class TestStudentDataTransformer:
         assert transformer.df["Primer Nombre Alumno"].iloc[0] == "JUAN"
         assert transformer.df["Segundo Nombre Alumno"].iloc[0] == "PABLO"
 
+    def test_split_names_single_name(self, sample_input_csv):
+        """Test that names without a space get no second name."""
+        transformer = StudentDataTransformer()
+        transformer.load_csv(sample_input_csv)
+        transformer.df["Nombres"] = ["JUAN", "MARIA ELENA DEL CARMEN"]
+        transformer.split_names()
+
+        assert transformer.df["Primer Nombre Alumno"].tolist() == ["JUAN", "MARIA"]
+        assert pd.isna(transformer.df["Segundo Nombre Alumno"].iloc[0])
+        assert transformer.df["Segundo Nombre Alumno"].iloc[1] == "ELENA DEL CARMEN"
+
+    def test_split_names_blank_column(self, sample_input_csv):
+        """Test that a guardian name column with no values at all still splits."""
+        transformer = StudentDataTransformer()
+        transformer.load_csv(sample_input_csv)
+        transformer.df["Nombre Apoderado"] = [np.nan, np.nan]
+        transformer.split_names()
+
+        assert transformer.df["Primer Nombre Apoderado"].isna().all()
+        assert transformer.df["Segundo Nombre Apoderado"].isna().all()
+        assert "Nombre Apoderado" not in transformer.df.columns
+
     def test_create_course_codes(self, sample_input_csv):
         """Test course code creation."""
         transformer = StudentDataTransformer()
@@ -114,6 +195,18 @@ class TestStudentDataTransformer:
         assert transformer.df["curso_2024"].iloc[0] == "7A"
         assert transformer.df["curso_2024"].iloc[1] == "8B"
 
+    def test_map_comuna_codes(self, sample_input_csv):
+        """Test commune code mapping."""
+        transformer = StudentDataTransformer()
+        transformer.load_csv(sample_input_csv)
+        assert transformer.df is not None
+        transformer.df.loc[1, "Comuna"] = "9999"
+        transformer.map_comuna_codes()
+
+        assert transformer.df["Comuna"].iloc[0] == "LA SERENA"
+        # Unknown codes are kept as-is
+        assert transformer.df["Comuna"].iloc[1] == "9999"
+
     def test_transform_config_defaults(self):
         """Test default configuration."""
         config = TransformConfig()
@@ -128,6 +221,20 @@ class TestStudentDataTransformer:
         assert config.year == 2026
         assert config.local == "Anexo"
 
+    def test_transform_config_is_frozen_and_checked(self):
+        """Test that the configuration is immutable and rejects bad sizes."""
+        config = TransformConfig()
+        with pytest.raises(AttributeError):
+            config.rbd = 1
+        with pytest.raises(ValueError):
+            TransformConfig(chunk_size=0)
+        with pytest.raises(ValueError):
+            TransformConfig(preview_rows=0)
+
+    def test_output_columns_match_record_model(self):
+        """Test that the output column order matches the record model fields."""
+        assert list(StudentOutputRecord.model_fields) == OUTPUT_COLUMNS
+
     def test_full_transform_pipeline(self, sample_input_csv, tmp_path):
         """Test complete transformation pipeline."""
         transformer = StudentDataTransformer()
@@ -142,3 +249,205 @@ class TestStudentDataTransformer:
         output_path = tmp_path / "output.csv"
         transformer.save_csv(output_path)
         assert output_path.exists()
+
+    def test_save_csv_matches_pandas(self, sample_input_csv, tmp_path):
+        """Test that the Arrow writer produces the same file as DataFrame.to_csv."""
+        transformer = StudentDataTransformer()
+        result = transformer.transform(sample_input_csv)
+        result.loc[1, "direccion"] = 'CALLE "A"; 12'
+
+        output_path = tmp_path / "output.csv"
+        transformer.save_csv(output_path)
+        expected_path = tmp_path / "expected.csv"
+        result.to_csv(expected_path, sep=";", index=False, encoding="utf-8-sig")
+        assert output_path.read_bytes() == expected_path.read_bytes()
+
+        # Without values needing quotes, the Arrow writer is used
+        result.loc[1, "direccion"] = "CALLE A 12"
+        assert transformer._write_csv_arrow(output_path, append=False)
+        result.to_csv(expected_path, sep=";", index=False, encoding="utf-8-sig")
+        assert output_path.read_bytes() == expected_path.read_bytes()
+
+        # Float columns are only written by Arrow when they hold no values
+        result["tutor2Paterno"] = float("nan")
+        assert transformer._write_csv_arrow(output_path, append=False)
+        result.to_csv(expected_path, sep=";", index=False, encoding="utf-8-sig")
+        assert output_path.read_bytes() == expected_path.read_bytes()
+        result.loc[0, "tutor2Paterno"] = 1.0
+        assert not transformer._write_csv_arrow(output_path, append=False)
+
+    def test_save_csv_old_pyarrow_falls_back(self, sample_input_csv, tmp_path, monkeypatch):
+        """Test that pandas writes the file when WriteOptions lacks quoting_header."""
+        transformer = StudentDataTransformer()
+        result = transformer.transform(sample_input_csv)
+        arrow_write_options = pa_csv.WriteOptions
+
+        def write_options(**kwargs):
+            if "quoting_header" in kwargs:
+                raise TypeError("unexpected keyword argument 'quoting_header'")
+            return arrow_write_options(**kwargs)
+
+        monkeypatch.setattr("dobby.transformer.pa_csv.WriteOptions", write_options)
+        output_path = tmp_path / "output.csv"
+        assert not transformer._write_csv_arrow(output_path, append=False)
+        transformer.save_csv(output_path)
+        expected_path = tmp_path / "expected.csv"
+        result.to_csv(expected_path, sep=";", index=False, encoding="utf-8-sig")
+        assert output_path.read_bytes() == expected_path.read_bytes()
+
+    def test_csv_engines_match(self, sample_input_csv, tmp_path):
+        """Test that the pandas and pyarrow engines write the same output."""
+        outputs = []
+        for engine in ("pyarrow", "pandas"):
+            transformer = StudentDataTransformer(TransformConfig(csv_engine=engine))
+            transformer.transform(sample_input_csv)
+            output_path = tmp_path / f"{engine}.csv"
+            transformer.save_csv(output_path)
+            outputs.append(output_path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+
+    def test_csv_engine_used_when_streaming(self, sample_input_csv, tmp_path):
+        """Test that streamed runs honour csv_engine, skipping the cache with pandas."""
+        outputs = []
+        for engine in ("pyarrow", "pandas"):
+            config = TransformConfig(csv_engine=engine, cache_parsed_csv=True, chunk_size=1)
+            output_path = tmp_path / f"{engine}.csv"
+            StudentDataTransformer(config).transform_to_csv(sample_input_csv, output_path)
+            outputs.append(output_path.read_bytes())
+            caches = list(sample_input_csv.parent.glob(".input.csv.*.feather"))
+            assert len(caches) == (1 if engine == "pyarrow" else 0)
+            for cache in caches:
+                cache.unlink()
+
+        assert outputs[0] == outputs[1]
+
+    def test_transform_resets_previous_run(self, sample_input_csv):
+        """Test that reusing a transformer does not carry errors between runs."""
+        transformer = StudentDataTransformer()
+        transformer.errors.add(0, "Rut", "1-1", "Invalid RUT check digit")
+        transformer.transform(sample_input_csv)
+        first_errors = len(transformer.errors)
+
+        transformer.reset(TransformConfig(rbd=123))
+        assert transformer.df is None
+        assert len(transformer.errors) == 0
+
+        result = transformer.transform(sample_input_csv)
+        assert len(transformer.errors) == first_errors
+        assert (result["rbd"] == 123).all()
+
+    def test_transform_stream_matches_full_transform(self, sample_input_csv, tmp_path):
+        """Test that chunked transformation writes the same output as a full run."""
+        full_path = tmp_path / "full.csv"
+        full = StudentDataTransformer()
+        full.transform(sample_input_csv)
+        full.save_csv(full_path)
+
+        stream_path = tmp_path / "stream.csv"
+        streamed = StudentDataTransformer()
+        for i, chunk in enumerate(streamed.transform_stream(sample_input_csv, chunk_size=1)):
+            assert len(chunk) == 1
+            streamed.save_csv(stream_path, append=i > 0)
+
+        assert streamed.input_row_count == 2
+        assert streamed.input_bytes_read == sample_input_csv.stat().st_size
+        assert stream_path.read_bytes() == full_path.read_bytes()
+
+    def test_transform_to_csv_uses_config_chunk_size(self, sample_input_csv, tmp_path):
+        """Test that transform_to_csv streams chunks of config.chunk_size rows."""
+        full_path = tmp_path / "full.csv"
+        full = StudentDataTransformer()
+        full.transform(sample_input_csv)
+        full.save_csv(full_path)
+
+        stream_path = tmp_path / "stream.csv"
+        streamed = StudentDataTransformer(TransformConfig(chunk_size=1))
+        assert streamed.transform_to_csv(sample_input_csv, stream_path) == 2
+        assert streamed.df is not None
+        assert len(streamed.df) == 1
+        assert stream_path.read_bytes() == full_path.read_bytes()
+
+    def test_transform_to_csv_chunk_types_match_full_run(self, sample_input_csv, tmp_path):
+        """Test that chunks with blank names or grades are read with the same types."""
+        df = pd.read_csv(sample_input_csv, sep=";", encoding="utf-8-sig", dtype=str)
+        df.loc[0, "Grado"] = None
+        df.loc[1, "Nombre Apoderado"] = None
+        df.to_csv(sample_input_csv, sep=";", index=False, encoding="utf-8-sig")
+
+        full = StudentDataTransformer()
+        result = full.transform(sample_input_csv)
+        full.save_csv(tmp_path / "full.csv")
+        assert result["curso"].iloc[1] == "8B"
+
+        streamed = StudentDataTransformer(TransformConfig(chunk_size=1))
+        streamed.transform_to_csv(sample_input_csv, tmp_path / "stream.csv")
+        assert (tmp_path / "stream.csv").read_bytes() == (tmp_path / "full.csv").read_bytes()
+
+    def test_transform_to_csv_failure_keeps_previous_output(
+        self, sample_input_csv, tmp_path, monkeypatch
+    ):
+        """Test that a run failing after some chunks leaves no partial output."""
+        output_path = tmp_path / "output.csv"
+        output_path.write_text("previous run")
+        chunks_done = []
+
+        def fail_on_second_chunk(transformer):
+            chunks_done.append(len(transformer.df))
+            if len(chunks_done) == 2:
+                raise ValueError("broken chunk")
+
+        monkeypatch.setattr(StudentDataTransformer, "validate_emails", fail_on_second_chunk)
+        transformer = StudentDataTransformer(TransformConfig(chunk_size=1))
+        with pytest.raises(TransformationError):
+            transformer.transform_to_csv(sample_input_csv, output_path)
+
+        assert output_path.read_text() == "previous run"
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["input.csv", "output.csv"]
+
+    def test_transform_stream_parallel_matches_sequential(self, sample_input_csv, tmp_path):
+        """Test that chunks transformed in worker processes keep order and errors."""
+        sequential = StudentDataTransformer()
+        expected = pd.concat(list(sequential.transform_stream(sample_input_csv, chunk_size=1)))
+
+        parallel = StudentDataTransformer()
+        chunks = list(parallel.transform_stream(sample_input_csv, chunk_size=1, workers=2))
+
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+        assert parallel.errors[:] == sequential.errors[:]
+        assert parallel.input_row_count == 2
+
+    def test_parse_cache_reused(self, sample_input_csv):
+        """Test that the Feather cache is written once and reused by later runs."""
+        config = TransformConfig(cache_parsed_csv=True)
+        first = StudentDataTransformer(config)
+        first.load_csv(sample_input_csv)
+        caches = list(sample_input_csv.parent.glob(".input.csv.*.feather"))
+        assert len(caches) == 1
+
+        second = StudentDataTransformer(config)
+        chunks = list(second.iter_csv_chunks(sample_input_csv, chunk_size=1))
+        assert [chunk.index[0] for chunk in chunks] == [0, 1]
+        assert second.input_row_count == 2
+        assert second.input_bytes_read == sample_input_csv.stat().st_size
+        assert first.df is not None
+        pd.testing.assert_frame_equal(pd.concat(chunks), first.df)
+        assert list(sample_input_csv.parent.glob(".input.csv.*.feather")) == caches
+
+    def test_parse_cache_keyed_by_options(self, sample_input_csv):
+        """Test that the cache key covers parse options and spares other files' caches."""
+        input_csv = sample_input_csv.rename(sample_input_csv.with_name("in[p]ut.csv"))
+        decoy = input_csv.with_name(".input.csv.1-2-00000000.feather")
+        decoy.write_bytes(b"")
+
+        StudentDataTransformer(TransformConfig(cache_parsed_csv=True)).load_csv(input_csv)
+        (semicolon_cache,) = input_csv.parent.glob(".in[[]p]ut.csv.*.feather")
+        latin1 = StudentDataTransformer(
+            TransformConfig(cache_parsed_csv=True, input_encoding="latin-1")
+        )
+        latin1.load_csv(input_csv)
+        (latin1_cache,) = input_csv.parent.glob(".in[[]p]ut.csv.*.feather")
+
+        assert latin1_cache != semicolon_cache
+        assert latin1.df is not None and "Rut" not in latin1.df.columns
+        assert decoy.exists()
@@ -1,13 +1,21 @@
 """Tests for validators module."""
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 from dobby.validators import (
     clean_address,
+    clean_addresses,
+    clean_phones,
     format_rut,
+    rut_check_digits,
     validate_email,
+    validate_emails,
     validate_phone,
     validate_rut,
+    validate_ruts,
 )
 
 
@@ -57,6 +65,33 @@ class TestRutValidation:
         assert validate_rut("100000000-9") is True
         assert validate_rut("100000000-K") is True
 
+    def test_rut_check_digits(self):
+        """Test vectorized check digit computation."""
+        digits = rut_check_digits(np.array([12345678, 23762615, 11111111]))
+        assert digits.tolist() == ["5", "K", "1"]
+
+    def test_validate_ruts_matches_validate_rut(self):
+        """Test that column validation agrees with single RUT validation."""
+        ruts = pd.Series([
+            "12345678-5",
+            "23762615-K",
+            "12345678-9",
+            "1.234.567-4",
+            "100000000-9",
+            "invalid",
+            "",
+            None,
+        ])
+        expected = [validate_rut(rut) for rut in ruts]
+        assert validate_ruts(ruts).tolist() == expected
+
+    def test_rut_unicode_digits(self):
+        """Test that full-width and Arabic-Indic digits are read as digits everywhere."""
+        ruts = ["１２３４５６７８-5", "١٢٣٤٥٦٧٨-5", "１２３４５６７８-6", "12345678-5"]
+        assert [validate_rut(rut) for rut in ruts] == [True, True, False, True]
+        for dtype in (object, pd.ArrowDtype(pa.string())):
+            assert validate_ruts(pd.Series(ruts, dtype=dtype)).tolist() == [True, True, False, True]
+
 
 class TestEmailValidation:
     """Tests for email validation."""
@@ -74,6 +109,12 @@ class TestEmailValidation:
         assert validate_email("") is False
         assert validate_email(None) is False
 
+    def test_validate_emails_matches_validate_email(self):
+        """Test that column validation agrees with single email validation."""
+        emails = pd.Series(["user@example.com", "invalid", "@example.com", "user@", "A@B.CO"])
+        expected = [validate_email(email) for email in emails]
+        assert validate_emails(emails).tolist() == expected
+
 
 class TestPhoneValidation:
     """Tests for phone validation."""
@@ -114,6 +155,38 @@ class TestPhoneValidation:
         assert validate_phone("96898722") is False
         # Too many digits
         assert validate_phone(9876543210) is False
+        # Booleans are not numbers
+        assert validate_phone(True) is False
+
+    def test_clean_phones_numeric_column(self):
+        """Test cleaning a numeric phone column with missing values."""
+        phones = pd.Series([932832346.0, np.nan, 223456789.0, 123.0, 0.0])
+        cleaned = clean_phones(phones)
+        assert cleaned.fillna(-1).tolist() == [932832346, 0, 223456789, -1, 0]
+
+    def test_clean_phones_unicode_digits(self):
+        """Test that full-width and Arabic-Indic digits are read as digits."""
+        phones = ["９８７６５４３２１", "٩٨٧٦٥٤٣٢١", "９８７６５４３２１.0", "98765432¹"]
+        assert validate_phone(phones[0]) is True
+        for dtype in (object, "string", pd.ArrowDtype(pa.string())):
+            cleaned = clean_phones(pd.Series(phones, dtype=dtype))
+            assert cleaned.fillna(-1).tolist() == [987654321, 987654321, 987654321, -1]
+
+    def test_clean_phones_text_column(self):
+        """Test cleaning phones written with separators and float notation."""
+        phones = pd.Series(
+            ["+56 9 3283 2346", "9-3283-2346", "932832346.0", "0932832346", "", None, "12.345.678"]
+        )
+        cleaned = clean_phones(phones)
+        assert cleaned.fillna(-1).tolist() == [
+            932832346,
+            932832346,
+            932832346,
+            932832346,
+            0,
+            0,
+            -1,
+        ]
 
 
 class TestAddressCleaning:
@@ -142,3 +215,15 @@ class TestAddressCleaning:
         address = "Calle   Principal    123"
         cleaned = clean_address(address)
         assert "  " not in cleaned
+
+    def test_clean_addresses_matches_clean_address(self):
+        """Test that column cleaning agrees with single address cleaning."""
+        addresses = pd.Series([
+            "Calle Principal 123, La Serena",
+            "Calle   Principal    123",
+            "Los Aromos 12\xa0VICUÑA",
+            "",
+            None,
+        ])
+        expected = [clean_address(address) for address in addresses]
+        assert clean_addresses(addresses).tolist() == expected